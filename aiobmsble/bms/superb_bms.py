@@ -78,8 +78,9 @@ class BMS(BaseBMS):
         await asyncio.wait_for(self._wait_event(), timeout=BMS.TIMEOUT)
         result: BMSSample = self._decode_data(BMS._FIELDS, self._msg)
 
-        result["current"] = round(unpack_from(">f", self._msg, 8)[0], 3)
-        result["voltage"] = round(unpack_from(">f", self._msg, 12)[0], 3)
+        current, voltage = unpack_from(">2f", self._msg, 8)
+        result["current"] = round(current, 3)
+        result["voltage"] = round(voltage, 3)
 
         # remove runtime if not discharging
         if result.get("current", 0) >= 0:
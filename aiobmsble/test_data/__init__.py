@@ -107,6 +107,7 @@ def bms_advertisements(bms_filter: str | None = None) -> tuple[BmsAdvSample, ...
 
     return tuple(generate_entries())
 
+@lru_cache(maxsize=1)
 def ignore_advertisements() -> tuple[BmsAdvSample, ...]:
     """Provide a list of advertisements that shall not be identified as a valid BMS.
 
@@ -7,38 +7,81 @@ Note: Test values updated on 2025-08-06 to match corrected field offsets:
 """
 
 import asyncio
+from collections.abc import Mapping
 import contextlib
-import logging
+from types import MappingProxyType
+from typing import ClassVar, Final, Literal
 
 from bleak.backends.device import BLEDevice
 import pytest
 
-from aiobmsble import BMSSample
+from aiobmsble import BMSSample, TempSensor as TS
 from aiobmsble.bms.pro_bms import BMS
 from tests.bluetooth import generate_ble_device
 from tests.conftest import MockBleakClient
 from tests.test_basebms import BMSBasicTests
 
 # Actual recorded packets from device logs
-RECORDED_PACKETS: dict[str, bytearray] = {
-    "init_response": bytearray.fromhex(
-        "55aa080380aa01040000002c52"
-    ),  # Initialization response packet fct. 0x04
-    "data_discharging": bytearray.fromhex(
-        "55aa2d0480aa01701c05000096090080e2000000ad19000033000000ca050000890c0000770b0000044e000082648e684000"
-    ),  # fct. 0x70, 13.08V, -2.454A, 22.6°C, 51% SOC
-    "data_charging": bytearray.fromhex(
-        "55aa2d0480aa01703b05000066340000da00000057100000200000008601000029460000580a0000eb4600000bd98c68afff"
-    ),  # fct. 0x70, 13.39V, 13.414A, 21.8°C, 32% SOC
-    "data_with_protection": bytearray.fromhex(
-        "55aa2d0480aa01701c05000096090081e2000000ad19000033000000ca050000890c0000770b0000044e000082648e684000"
-    ),  # fct. 0x70, Same as discharging but with protection bit
-    "data_zero_soc": bytearray.fromhex(
-        "55aa2d0480aa01703b05000066340000da00000057100000000000008601000029460000580a0000eb4600000bd98c68afff"
-    ),  # fct. 0x70, Same as charging but with 0% SOC
-    "basic_machine_info": bytearray.fromhex(
-        "55aa200380aa0140008000000002000000f7040000c800000004010000065eaf7a4ee0f700"
-    ),  # fct. 0x40, SW version 0x0104 => 1.4
+RECORDED_PACKETS: Final[Mapping[str, bytes]] = MappingProxyType(
+    {
+        "init_response": (
+            b"\x55\xaa\x08\x03\x80\xaa\x01\x04\x00\x00\x00\x2c\x52"
+        ),  # Initialization response packet fct. 0x04
+        "data_discharging": (
+            b"\x55\xaa\x2d\x04\x80\xaa\x01\x70\x1c\x05\x00\x00\x96\x09\x00\x80\xe2\x00\x00\x00\xad"
+            b"\x19\x00\x00\x33\x00\x00\x00\xca\x05\x00\x00\x89\x0c\x00\x00\x77\x0b\x00\x00\x04\x4e"
+            b"\x00\x00\x82\x64\x8e\x68\x40\x00"
+        ),  # fct. 0x70, 13.08V, -2.454A, 22.6°C, 51% SOC
+        "data_charging": (
+            b"\x55\xaa\x2d\x04\x80\xaa\x01\x70\x3b\x05\x00\x00\x66\x34\x00\x00\xda\x00\x00\x00\x57"
+            b"\x10\x00\x00\x20\x00\x00\x00\x86\x01\x00\x00\x29\x46\x00\x00\x58\x0a\x00\x00\xeb\x46"
+            b"\x00\x00\x0b\xd9\x8c\x68\xaf\xff"
+        ),  # fct. 0x70, 13.39V, 13.414A, 21.8°C, 32% SOC
+        "data_with_protection": (
+            b"\x55\xaa\x2d\x04\x80\xaa\x01\x70\x1c\x05\x00\x00\x96\x09\x00\x81\xe2\x00\x00\x00\xad"
+            b"\x19\x00\x00\x33\x00\x00\x00\xca\x05\x00\x00\x89\x0c\x00\x00\x77\x0b\x00\x00\x04\x4e"
+            b"\x00\x00\x82\x64\x8e\x68\x40\x00"
+        ),  # fct. 0x70, Same as discharging but with protection bit
+        "data_zero_soc": (
+            b"\x55\xaa\x2d\x04\x80\xaa\x01\x70\x3b\x05\x00\x00\x66\x34\x00\x00\xda\x00\x00\x00\x57"
+            b"\x10\x00\x00\x00\x00\x00\x00\x86\x01\x00\x00\x29\x46\x00\x00\x58\x0a\x00\x00\xeb\x46"
+            b"\x00\x00\x0b\xd9\x8c\x68\xaf\xff"
+        ),  # fct. 0x70, Same as charging but with 0% SOC
+        "basic_machine_info": (
+            b"\x55\xaa\x20\x03\x80\xaa\x01\x40\x00\x80\x00\x00\x00\x02\x00\x00\x00\xf7\x04\x00\x00"
+            b"\xc8\x00\x00\x00\x04\x01\x00\x00\x06\x5e\xaf\x7a\x4e\xe0\xf7\x00"
+        ),  # fct. 0x40, SW version 0x0104 => 1.4
+    }
+)
+
+
+_RESULT_DISCHARGING: Final[BMSSample] = {
+    "voltage": 13.08,
+    "current": -2.454,  # 0x96090080: discharge
+    "temperature": 22.6,
+    "temp_values": [TS(22.6)],
+    "battery_level": 51,
+    "battery_charging": False,
+    "cycle_charge": 65.73,
+    "cycle_capacity": 859.748,
+    "power": -32.09,
+    "runtime": 96425,
+    "problem_code": 0,
+    "problem": False,
+}
+
+_RESULT_CHARGING: Final[BMSSample] = {
+    "voltage": 13.39,
+    "current": 13.414,
+    "temperature": 21.8,
+    "temp_values": [TS(21.8)],
+    "battery_level": 32,
+    "battery_charging": True,
+    "cycle_charge": 41.83,
+    "cycle_capacity": 560.104,
+    "power": 179.61,
+    "problem_code": 0,
+    "problem": False,
 }
 
 
@@ -51,46 +94,52 @@ class TestBasicBMS(BMSBasicTests):
 class MockProBMSBleakClient(MockBleakClient):
     """Mock Pro BMS BleakClient for testing."""
 
-    _init_packet: bytearray = RECORDED_PACKETS["init_response"]
+    _init_packet: bytes = RECORDED_PACKETS["init_response"]
+    _EXPECTED_INIT: ClassVar[bytes] = BMS._HEAD + BMS._CMD_INIT
+    _EXPECTED_TRIG: ClassVar[bytes] = BMS._HEAD + BMS._CMD_TRIGGER_DATA
+    # send a single data packet or stream continuously after the trigger command
+    _streaming_mode: ClassVar[Literal["once", "loop"]] = "once"
 
     def __init__(
         self, address_or_ble_device, disconnected_callback=None, **kwargs
     ) -> None:
         """Initialize the mock client."""
         super().__init__(address_or_ble_device, disconnected_callback, **kwargs)
-        self._test_packet: bytearray = RECORDED_PACKETS["data_discharging"]
+        self._test_packet: bytes = RECORDED_PACKETS["data_discharging"]
         self._streaming_task: asyncio.Task[None] | None = None
         self._stop_streaming: bool = False
 
-    def set_test_packet(self, packet: bytearray) -> None:
+    def set_test_packet(self, packet: bytes) -> None:
         """Set the packet to return."""
         self._test_packet = packet
 
+    def push(self) -> None:
+        """Send the test packet as notification, like a streaming device."""
+        if self._notify_callback and self._test_packet:
+            self._notify_callback(None, self._test_packet)
+
     async def _stream_data(self) -> None:
         """Continuously stream data packets like a real device."""
-        # Wait for initialization to complete and the 1-second sleep
-
         while not self._stop_streaming:
-            if self._notify_callback and self._test_packet:
-                self._notify_callback(None, self._test_packet)
-            # Send data, real every 500ms, but use shorter sleep to speed up tests
+            self.push()
             await asyncio.sleep(0)
 
     async def write_gatt_char(self, char_specifier, data, response=None):
         """Mock write to handle initialization and data requests."""
         await super().write_gatt_char(char_specifier, data, response)
 
-        if data == BMS._HEAD + BMS._CMD_INIT:
+        if data == self._EXPECTED_INIT:
             # Send initialization response
             if self._notify_callback:
                 self._notify_callback(None, self._init_packet)
 
-        elif data == BMS._HEAD + BMS._CMD_TRIGGER_DATA:
-            # Start streaming data packets
-            if not self._streaming_task:
+        elif data == self._EXPECTED_TRIG:
+            # Start streaming on next yield, i.e. after BMS initialization
+            if self._streaming_mode == "once":
+                asyncio.get_running_loop().call_soon(self.push)
+            elif not self._streaming_task:
                 self._stop_streaming = False
                 self._streaming_task = asyncio.create_task(self._stream_data())
-                await asyncio.sleep(0) # yield control to allow task to start
 
     async def disconnect(self) -> None:
         """Stop streaming on disconnect."""
@@ -103,80 +152,46 @@ class MockProBMSBleakClient(MockBleakClient):
 
 
 @pytest.mark.asyncio
-async def test_async_update_discharging(patch_bleak_client) -> None:
+async def test_async_update_discharging(
+    patch_bleak_client, ble_device: BLEDevice
+) -> None:
     """Test async update with discharging data."""
-    device: BLEDevice = generate_ble_device("AA:BB:CC:DD:EE:FF", "Pro BMS")
-    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(device)
+    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(ble_device)
     mock_client.set_test_packet(RECORDED_PACKETS["data_discharging"])
     patch_bleak_client(lambda *args, **kwargs: mock_client)
 
-    bms = BMS(device)
-
-    assert await bms.async_update() == {
-        "voltage": 13.08,
-        "current": -2.454,  # 0x96090080: discharge
-        "temperature": 22.6,
-        "temp_values": [22.6],
-        "battery_level": 51,
-        "battery_charging": False,
-        "cycle_charge": 65.73,
-        "cycle_capacity": 859.748,
-        "power": -32.09,
-        "runtime": 96425,
-        "problem_code": 0,
-        "problem": False,
-    }
+    bms = BMS(ble_device)
+
+    assert await bms.async_update() == _RESULT_DISCHARGING
 
     await bms.disconnect()
 
 
 @pytest.mark.asyncio
-async def test_async_update_charging(patch_bleak_client) -> None:
+async def test_async_update_charging(patch_bleak_client, ble_device: BLEDevice) -> None:
     """Test async update with charging data."""
-    device: BLEDevice = generate_ble_device("AA:BB:CC:DD:EE:FF", "Pro BMS")
-    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(device)
+    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(ble_device)
     mock_client.set_test_packet(RECORDED_PACKETS["data_charging"])
     patch_bleak_client(lambda *args, **kwargs: mock_client)
 
-    bms = BMS(device)
-
-    assert await bms.async_update() == {
-        "voltage": 13.39,
-        "current": 13.414,
-        "temperature": 21.8,
-        "temp_values": [21.8],
-        "battery_level": 32,
-        "battery_charging": True,
-        "cycle_charge": 41.83,
-        "cycle_capacity": 560.104,
-        "power": 179.61,
-        "problem_code": 0,
-        "problem": False,
-    }
+    bms = BMS(ble_device)
+
+    assert await bms.async_update() == _RESULT_CHARGING
     await bms.disconnect()
 
 
 @pytest.mark.asyncio
-async def test_async_update_with_protection(patch_bleak_client) -> None:
+async def test_async_update_with_protection(
+    patch_bleak_client, ble_device: BLEDevice
+) -> None:
     """Test async update with protection status."""
-    device: BLEDevice = generate_ble_device("AA:BB:CC:DD:EE:FF", "Pro BMS")
-    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(device)
+    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(ble_device)
     mock_client.set_test_packet(RECORDED_PACKETS["data_with_protection"])
     patch_bleak_client(lambda *args, **kwargs: mock_client)
 
-    bms = BMS(device)
-
-    assert await bms.async_update() == {
-        "voltage": 13.08,
-        "current": -2.454,  # 0x96090080: discharge
-        "temperature": 22.6,
-        "temp_values": [22.6],
-        "battery_level": 51,
-        "battery_charging": False,
-        "cycle_charge": 65.73,
-        "cycle_capacity": 859.748,
-        "power": -32.09,
-        "runtime": 96425,
+    bms = BMS(ble_device)
+
+    assert await bms.async_update() == _RESULT_DISCHARGING | {
         "problem_code": 1,  # 0x81 & 0x7F = 1
         "problem": True,
     }
@@ -185,17 +200,16 @@ async def test_async_update_with_protection(patch_bleak_client) -> None:
 
 @pytest.mark.asyncio
 async def test_async_update_incomplete_data(
-    patch_bleak_client, patch_bms_timeout
+    patch_bleak_client, patch_bms_timeout, ble_device: BLEDevice
 ) -> None:
     """Test handling of incomplete data packet."""
-    device: BLEDevice = generate_ble_device("AA:BB:CC:DD:EE:FF", "Pro BMS")
-    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(device)
+    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(ble_device)
     # Set incomplete data (too short)
-    mock_client.set_test_packet(bytearray.fromhex("55aa0d0480aa0170"))
+    mock_client.set_test_packet(b"\x55\xaa\x0d\x04\x80\xaa\x01\x70")
     patch_bms_timeout("pro_bms")
     patch_bleak_client(lambda *args, **kwargs: mock_client)
 
-    bms = BMS(device)
+    bms = BMS(ble_device)
 
     result: BMSSample = {}
     with pytest.raises(TimeoutError):
@@ -206,32 +220,22 @@ async def test_async_update_incomplete_data(
 
 
 @pytest.mark.asyncio
-async def test_async_update_already_streaming(patch_bleak_client) -> None:
+async def test_async_update_already_streaming(
+    monkeypatch: pytest.MonkeyPatch, patch_bleak_client, ble_device: BLEDevice
+) -> None:
     """Test async update when already streaming (second update)."""
-    device: BLEDevice = generate_ble_device("AA:BB:CC:DD:EE:FF", "Pro BMS")
-    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(device)
+    monkeypatch.setattr(MockProBMSBleakClient, "_streaming_mode", "loop")
+    mock_client: MockProBMSBleakClient = MockProBMSBleakClient(ble_device)
     mock_client.set_test_packet(RECORDED_PACKETS["data_charging"])
     patch_bleak_client(lambda *args, **kwargs: mock_client)
 
-    bms = BMS(device, keep_alive=True)
+    bms = BMS(ble_device, keep_alive=True)
 
     # First update to initialize
     await bms.async_update()
 
     # Second update should reuse existing connection
-    assert await bms.async_update() == {
-        "voltage": 13.39,
-        "current": 13.414,
-        "temperature": 21.8,
-        "temp_values": [21.8],
-        "battery_level": 32,
-        "battery_charging": True,
-        "cycle_charge": 41.83,
-        "cycle_capacity": 560.104,
-        "power": 179.61,
-        "problem_code": 0,
-        "problem": False,
-    }
+    assert await bms.async_update() == _RESULT_CHARGING
 
     await bms.disconnect()
 
@@ -299,7 +303,7 @@ async def test_invalid_response(
     monkeypatch: pytest.MonkeyPatch,
     patch_bleak_client,
     patch_bms_timeout,
-    wrong_response: bytearray,
+    wrong_response: bytes,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test data up date with BMS returning invalid data."""
@@ -310,11 +314,13 @@ async def test_invalid_response(
 
     bms = BMS(generate_ble_device())
 
-    logging.getLogger(__name__)
     result: BMSSample = {}
-    with caplog.at_level(logging.DEBUG), pytest.raises(TimeoutError):
+    with pytest.raises(TimeoutError):
         result = await bms.async_update()
     assert not result
-    assert "failed to initialize BMS connection" in caplog.text
+    assert any(
+        "failed to initialize BMS connection" in record.getMessage()
+        for record in caplog.records
+    )
 
     await bms.disconnect()
@@ -1,7 +1,8 @@
 """Test the Renogy Pro BMS implementation."""
 
-from collections.abc import Buffer
-from typing import Final
+from collections.abc import Buffer, Mapping
+from types import MappingProxyType
+from typing import ClassVar, Final
 from uuid import UUID
 
 from bleak.backends.characteristic import BleakGATTCharacteristic
@@ -18,34 +19,42 @@ from tests.test_basebms import BMSBasicTests
 BT_FRAME_SIZE = 512  # ATT max is 512 bytes
 
 
+_REF_VALUE: Final[BMSSample] = {
+    "battery_charging": False,
+    "battery_level": 99.0,
+    "cell_voltages": [3.3, 3.3, 3.3, 3.3],
+    "cell_count": 4,
+    "current": -1.2,
+    "cycle_capacity": 2779.195,
+    "cycle_charge": 208.962,
+    "cycles": 6,
+    "delta_voltage": 0.0,
+    "design_capacity": 211,
+    "power": -15.96,
+    "problem": False,
+    "problem_code": 0,
+    "runtime": 626886,
+    "temp_values": [TS(27.3), TS(26.8), TS(27.5)],
+    "temp_sensors": 3,
+    "temperature": 27.2,
+    "voltage": 13.3,
+    "chrg_mosfet": True,
+    "dischrg_mosfet": True,
+    "heater": False,
+}
+
+
 def ref_value() -> BMSSample:
     """Return reference value for mock Renogy Pro BMS."""
-    return {
-        "battery_charging": False,
-        "battery_level": 99.0,
-        "cell_voltages": [3.3, 3.3, 3.3, 3.3],
-        "cell_count": 4,
-        "current": -1.2,
-        "cycle_capacity": 2779.195,
-        "cycle_charge": 208.962,
-        "cycles": 6,
-        "delta_voltage": 0.0,
-        "design_capacity": 211,
-        "power": -15.96,
-        "problem": False,
-        "problem_code": 0,
-        "runtime": 626886,
-        "temp_values": [TS(27.3), TS(26.8), TS(27.5)],
-        "temp_sensors": 3,
-        "temperature": 27.2,
-        "voltage": 13.3,
-        "chrg_mosfet": True,
-        "dischrg_mosfet": True,
-        "heater": False,
-    }
+    return _REF_VALUE.copy()
 
 
 BASE_VALUE_CMD: Final[bytes] = b"\x30\x03\x13\xb2\x00\x07\xa4\x8a"
+_UUID_TX: Final[str] = normalize_uuid_str("ffd1")
+_UUID_SERVICES: Final[tuple[str, str]] = (
+    normalize_uuid_str("ffd0"),
+    normalize_uuid_str("fff0"),
+)
 
 
 class TestBasicBMS(BMSBasicTests):
@@ -56,30 +65,35 @@ class TestBasicBMS(BMSBasicTests):
 class MockRenogyProBleakClient(MockBleakClient):
     """Emulate a Renogy Pro BMS BleakClient."""
 
-    RESP: dict[bytes, bytearray] = {
-        b"\x30\x03\x13\x88\x00\x22\x45\x5c": bytearray(
-            b"\x30\x03\x44\x00\x04\x00\x21\x00\x21\x00\x21\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00"
-            b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x01\x11\x01"
-            b"\x0c\x01\x13\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
-            b"\x00\x00\x00\x00\x00\x00\x00\x00\x65\x4a"
-        ),
-        BASE_VALUE_CMD: bytearray(
-            b"\x30\x03\x0e\xff\xf4\x00\x85\x00\x03\x30\x42\x00\x03\x3b\xda\x00\x06\x3e\x33"
-        ),  # -1.2A, 13.3V, 208.9Ah [mAh], 211.9Ah [mAh], 6 cycles
-         b"\x30\x03\x13\xec\x00\x08\x85\x5c": bytearray(
-            b"\x30\x03\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\xf7\x62"
-        ),
-    }
+    RESP: Mapping[bytes, bytes] = MappingProxyType(
+        {
+            b"\x30\x03\x13\x88\x00\x22\x45\x5c": (
+                b"\x30\x03\x44\x00\x04\x00\x21\x00\x21\x00\x21\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00"
+                b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x01\x11\x01"
+                b"\x0c\x01\x13\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+                b"\x00\x00\x00\x00\x00\x00\x00\x00\x65\x4a"
+            ),
+            BASE_VALUE_CMD: (
+                b"\x30\x03\x0e\xff\xf4\x00\x85\x00\x03\x30\x42\x00\x03\x3b\xda\x00\x06\x3e\x33"
+            ),  # -1.2A, 13.3V, 208.9Ah [mAh], 211.9Ah [mAh], 6 cycles
+            b"\x30\x03\x13\xec\x00\x08\x85\x5c": (
+                b"\x30\x03\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\xf7\x62"
+            ),
+        }
+    )
+
+    _gatt_services: ClassVar[BleakGATTServiceCollection | None] = None
 
     def _response(
         self, char_specifier: BleakGATTCharacteristic | int | str | UUID, cmd: bytes
-    ) -> bytearray:
-        if isinstance(char_specifier, str) and normalize_uuid_str(
-            char_specifier
-        ) != normalize_uuid_str("ffd1"):
-            return bytearray()
+    ) -> bytes:
+        if (
+            isinstance(char_specifier, str)
+            and normalize_uuid_str(char_specifier) != _UUID_TX
+        ):
+            return b""
 
-        return self.RESP.get(cmd, bytearray())
+        return self.RESP.get(cmd, b"")
 
     async def write_gatt_char(
         self,
@@ -92,20 +106,24 @@ class MockRenogyProBleakClient(MockBleakClient):
 
         assert self._notify_callback is not None
 
-        resp: bytearray = self._response(char_specifier, bytes(data))
-        for notify_data in [
-            resp[i : i + BT_FRAME_SIZE] for i in range(0, len(resp), BT_FRAME_SIZE)
-        ]:
-            self._notify_callback("MockRenogyProBleakClient", notify_data)
+        resp: bytes = self._response(char_specifier, bytes(data))
+        for i in range(0, len(resp), BT_FRAME_SIZE):
+            self._notify_callback(
+                "MockRenogyProBleakClient", resp[i : i + BT_FRAME_SIZE]
+            )
 
     @property
     def services(self) -> BleakGATTServiceCollection:
-        """Emulate Renogy BT service setup."""
+        """Emulate Renogy BT service setup, the static layout is built once."""
+
+        cls: type[MockRenogyProBleakClient] = type(self)
+        if cls._gatt_services is not None:
+            return cls._gatt_services
 
         serv_col = BleakGATTServiceCollection()
         for service in (
-            BleakGATTService(None, 1, uuid=normalize_uuid_str("ffd0")),
-            BleakGATTService(None, 5, uuid=normalize_uuid_str("fff0")),
+            BleakGATTService(None, 1, uuid=_UUID_SERVICES[0]),
+            BleakGATTService(None, 5, uuid=_UUID_SERVICES[1]),
         ):
             service.add_characteristic(
                 DefGATTChar(
@@ -134,6 +152,7 @@ class MockRenogyProBleakClient(MockBleakClient):
 
             serv_col.add_service(service)
 
+        cls._gatt_services = serv_col
         return serv_col
 
 
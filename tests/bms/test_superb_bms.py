@@ -1,21 +1,18 @@
 """Test the Super-B BMS implementation."""
 
-from collections.abc import Awaitable, Callable
 from typing import Final
-from uuid import UUID
 
-from bleak.backends.characteristic import BleakGATTCharacteristic
 import pytest
 
 from aiobmsble import BMSSample
 from aiobmsble.bms.superb_bms import BMS
+from tests import conftest
 from tests.bluetooth import generate_ble_device
-from tests.conftest import MockBleakClient
 from tests.test_basebms import BMSBasicTests
 
 BT_FRAME_SIZE = 32
 
-_PROTO_DEFS: Final[bytearray] = bytearray(
+_PROTO_DEFS: Final[bytes] = (
     b"\x00\x75\x5e\x64\x00\x00\x01\xa4\xbe\xcc\xcc\xcd\x41\x62\x89\xc5\x00\x00\x00\x00"
 )
 
@@ -32,6 +29,20 @@ _RESULT_DEFS: Final[BMSSample] = {
     "problem_code": 0,
 }
 
+_RESULT_CHRG: Final[BMSSample] = {
+    "voltage": 14.159,
+    "current": 0.4,
+    "battery_health": 100,
+    "battery_level": 94,
+    "power": 5.664,
+    "battery_charging": True,
+    "balancer": False,
+    "problem": False,
+    "problem_code": 0,
+}  # no runtime while charging
+
+_RESULT_PROBLEM: Final[BMSSample] = _RESULT_DEFS | {"problem": True, "problem_code": 1}
+
 
 class TestBasicBMS(BMSBasicTests):
     """Test the basic BMS functionality."""
@@ -39,37 +50,20 @@ class TestBasicBMS(BMSBasicTests):
     bms_class = BMS
 
 
-class MockSuperBBleakClient(MockBleakClient):
+class MockSuperBBleakClient(conftest.MockFramedNotifyBleakClient):
     """Emulate a Super-B BMS BleakClient."""
 
-    _RESP: bytearray = _PROTO_DEFS
-
-    def _send_info(self) -> None:
-        assert self._notify_callback is not None
-        for notify_data in [
-            self._RESP[i : i + BT_FRAME_SIZE]
-            for i in range(0, len(self._RESP), BT_FRAME_SIZE)
-        ]:
-            self._notify_callback("MockSuperBBleakClient", notify_data)
-
-    @property
-    def is_connected(self) -> bool:
-        """Mock connected to retrigger frame transmission in MockClient."""
-        if self._connected and self._notify_callback is not None:
-            self._send_info()  # patch to provide data when not reconnecting
-        return self._connected
-
-    async def start_notify(
-        self,
-        char_specifier: BleakGATTCharacteristic | int | str | UUID,
-        callback: Callable[
-            [BleakGATTCharacteristic, bytearray], None | Awaitable[None]
-        ],
-        **kwargs,
-    ) -> None:
-        """Mock start_notify."""
-        await super().start_notify(char_specifier, callback)
-        self._send_info()
+    _FRAME_SIZE = BT_FRAME_SIZE
+    _RESP: bytes = _PROTO_DEFS
+
+
+@pytest.fixture
+def superb_mock(request: pytest.FixtureRequest) -> type[MockSuperBBleakClient]:
+    """Return a Super-B mock client class that sends the parametrized response."""
+    assert isinstance(request.param, bytes)
+    return type(
+        "MockSuperBRespBleakClient", (MockSuperBBleakClient,), {"_RESP": request.param}
+    )
 
 
 async def test_update(
@@ -97,21 +91,13 @@ async def test_update_chrg(monkeypatch: pytest.MonkeyPatch, patch_bleak_client)
     monkeypatch.setattr(
         MockSuperBBleakClient,
         "_RESP",
-        bytearray(
-            b"\x00\x75\x5e\x64\x00\x00\x01\xa4\x3e\xcc\xcc\xcd\x41\x62\x89\xc5\x00\x00\x00\x00"
-        ),
+        b"\x00\x75\x5e\x64\x00\x00\x01\xa4\x3e\xcc\xcc\xcd\x41\x62\x89\xc5\x00\x00\x00\x00",
     )
     patch_bleak_client(MockSuperBBleakClient)
 
     bms = BMS(generate_ble_device())
 
-    result: BMSSample = _RESULT_DEFS.copy() | {
-        "current": 0.4,
-        "battery_charging": True,
-        "power": 5.664,
-    }
-    del result["runtime"]
-    assert await bms.async_update() == result
+    assert await bms.async_update() == _RESULT_CHRG
 
 
 async def test_tx_notimplemented(patch_bleak_client) -> None:
@@ -126,24 +112,23 @@ async def test_tx_notimplemented(patch_bleak_client) -> None:
 
 
 @pytest.mark.parametrize(
-    ("wrong_response"),
+    ("superb_mock"),
     [
         b"",
         b"\x00\x72\x5e\x64\x00\x00\x01\xa4\xbe\xcc\xcc\xcd\x41\x62\x89\xc5\x00\x00\x00",
     ],
     ids=["empty", "too_short"],
+    indirect=True,
 )
 async def test_invalid_response(
-    monkeypatch: pytest.MonkeyPatch,
     patch_bleak_client,
     patch_bms_timeout,
-    wrong_response: bytes,
+    superb_mock: type[MockSuperBBleakClient],
 ) -> None:
     """Test data up date with BMS returning invalid data."""
 
     patch_bms_timeout("superb_bms")
-    monkeypatch.setattr(MockSuperBBleakClient, "_RESP", bytearray(wrong_response))
-    patch_bleak_client(MockSuperBBleakClient)
+    patch_bleak_client(superb_mock)
 
     bms = BMS(generate_ble_device())
 
@@ -156,25 +141,24 @@ async def test_invalid_response(
 
 
 @pytest.mark.parametrize(
-    ("problem_response"),
+    ("superb_mock"),
     [
         b"\x00\x74\x5e\x64\x00\x00\x01\xa4\xbe\xcc\xcc\xcd\x41\x62\x89\xc5\x00\x00\x00\x00",
         b"\x00\x72\x5e\x64\x00\x00\x01\xa4\xbe\xcc\xcc\xcd\x41\x62\x89\xc5\x00\x00\x00\x00",
     ],
     ids=["chrg_warning", "dischrg_warning"],
+    indirect=True,
 )
 async def test_problem_response(
-    monkeypatch: pytest.MonkeyPatch, patch_bleak_client, problem_response
+    patch_bleak_client, superb_mock: type[MockSuperBBleakClient]
 ) -> None:
     """Test data update with BMS returning error flags."""
 
-    monkeypatch.setattr(MockSuperBBleakClient, "_RESP", bytearray(problem_response))
-
-    patch_bleak_client(MockSuperBBleakClient)
+    patch_bleak_client(superb_mock)
 
     bms = BMS(generate_ble_device())
 
     result: BMSSample = await bms.async_update()
-    assert result == _RESULT_DEFS | {"problem": True, "problem_code": 1}
+    assert result == _RESULT_PROBLEM
 
     await bms.disconnect()
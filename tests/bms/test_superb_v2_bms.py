@@ -1,6 +1,6 @@
 """Test the Super-B v2 BMS implementation."""
 
-from collections.abc import Awaitable, Buffer, Callable
+from collections.abc import Buffer, Callable
 from typing import Final
 from uuid import UUID
 
@@ -10,14 +10,15 @@ import pytest
 
 from aiobmsble import BMSSample
 from aiobmsble.bms.superb_v2_bms import BMS
+from tests import conftest
 from tests.bluetooth import generate_ble_device
-from tests.conftest import MockBleakClient
 from tests.test_basebms import BMSBasicTests
 
 BT_FRAME_SIZE = 32
+_UUID_TX: Final[str] = normalize_uuid_str("cf9ccdfa-eee9-43ce-87a5-82b54af5324e")
 
-RESP: dict[bytes, bytearray] = {
-    b"\x21\x54\x00": bytearray(
+RESP: Final[dict[bytes, bytes]] = {
+    b"\x21\x54\x00": (
         b"\x00\x23\x04\x13\xff\xff\x81\xe3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x12\x64\x00\x01\x2f\x29"
     )
 }
@@ -43,51 +44,30 @@ class TestBasicBMS(BMSBasicTests):
     bms_class = BMS
 
 
-class MockSuperBv2BleakClient(MockBleakClient):
+class MockSuperBv2BleakClient(conftest.MockFramedNotifyBleakClient):
     """Emulate a Super-B v2 BMS BleakClient."""
 
-    _QUERY_RESP: dict[bytes, bytearray] = RESP
-    _NOTIFY_RESP: bytearray = bytearray(
+    _FRAME_SIZE = BT_FRAME_SIZE
+    _QUERY_RESP: dict[bytes, bytes] = RESP
+    _NOTIFY_RESP: bytes = (
         b"\x02\x0d\x00\x00\x00\x00\xff\xff\xf6\x5f\x33\x97\x00\x00\x09\x64\x00\x00\x00\x00\x00\x00"
         b"\x00\x00"
     )
 
-    def _send_info(self) -> None:
-        assert self._notify_callback is not None
-        for notify_data in [
-            self._NOTIFY_RESP[i : i + BT_FRAME_SIZE]
-            for i in range(0, len(self._NOTIFY_RESP), BT_FRAME_SIZE)
-        ]:
-            self._notify_callback("MockSuperBv2BleakClient", notify_data)
+    def _notify_resp(self) -> bytes:
+        """Return the notification response of the BMS."""
+        return self._NOTIFY_RESP
 
     def _response(
         self, char_specifier: BleakGATTCharacteristic | int | str | UUID, cmd: bytes
-    ) -> bytearray:
-        if isinstance(char_specifier, str) and normalize_uuid_str(
-            char_specifier
-        ) != normalize_uuid_str("cf9ccdfa-eee9-43ce-87a5-82b54af5324e"):
-            return bytearray()
-
-        return self._QUERY_RESP.get(cmd, bytearray())
-
-    @property
-    def is_connected(self) -> bool:
-        """Mock connected to retrigger frame transmission in MockClient."""
-        if self._connected and self._notify_callback is not None:
-            self._send_info()  # patch to provide data when not reconnecting
-        return self._connected
-
-    async def start_notify(
-        self,
-        char_specifier: BleakGATTCharacteristic | int | str | UUID,
-        callback: Callable[
-            [BleakGATTCharacteristic, bytearray], None | Awaitable[None]
-        ],
-        **kwargs,
-    ) -> None:
-        """Mock start_notify."""
-        await super().start_notify(char_specifier, callback)
-        self._send_info()
+    ) -> bytes:
+        if (
+            isinstance(char_specifier, str)
+            and normalize_uuid_str(char_specifier) != _UUID_TX
+        ):
+            return b""
+
+        return self._QUERY_RESP.get(cmd, b"")
 
     async def write_gatt_char(
         self,
@@ -98,13 +78,14 @@ class MockSuperBv2BleakClient(MockBleakClient):
         """Issue write command to GATT."""
         await super().write_gatt_char(char_specifier, data, response)
 
-        assert self._notify_callback is not None
+        notify: Final[Callable | None] = self._notify_callback
+        assert notify is not None
 
-        resp: bytearray = self._response(char_specifier, bytes(data))
-        for notify_data in [
-            resp[i : i + BT_FRAME_SIZE] for i in range(0, len(resp), BT_FRAME_SIZE)
-        ]:
-            self._notify_callback("MockSuperBv2BleakClient", notify_data)
+        resp: bytes = self._response(char_specifier, bytes(data))
+        if not resp:
+            return  # no response to unknown command
+        for i in range(0, len(resp), BT_FRAME_SIZE):
+            notify("MockSuperBv2BleakClient", resp[i : i + BT_FRAME_SIZE])
 
 
 async def test_update(
@@ -132,7 +113,7 @@ async def test_update_chrg(monkeypatch: pytest.MonkeyPatch, patch_bleak_client)
         MockSuperBv2BleakClient,
         "_QUERY_RESP",
         {
-            b"\x21\x54\x00": bytearray(
+            b"\x21\x54\x00": (
                 b"\x00\x23\x04\x13\x00\x01\xdf\xd9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x12\x64\xff\xff\xff\xff"
             )
         },
@@ -140,9 +121,7 @@ async def test_update_chrg(monkeypatch: pytest.MonkeyPatch, patch_bleak_client)
     monkeypatch.setattr(
         MockSuperBv2BleakClient,
         "_NOTIFY_RESP",
-        bytearray(
-            b"\x02\x0e\x00\x00\x00\x00\x00\x00\x24\x12\x33\xd9\x00\x00\x09\x64\x00\x00\x00\x00\x00\x00\x00\x00"
-        ),
+        b"\x02\x0e\x00\x00\x00\x00\x00\x00\x24\x12\x33\xd9\x00\x00\x09\x64\x00\x00\x00\x00\x00\x00\x00\x00",
     )
     patch_bleak_client(MockSuperBv2BleakClient)
 
@@ -163,13 +142,13 @@ async def test_update_chrg(monkeypatch: pytest.MonkeyPatch, patch_bleak_client)
     await bms.disconnect()
 
 
+_NOTIFY_SHORT: Final[bytes] = MockSuperBv2BleakClient._NOTIFY_RESP[:-1]
+_NOTIFY_LONG: Final[bytes] = MockSuperBv2BleakClient._NOTIFY_RESP + b"\x00"
+
+
 @pytest.mark.parametrize(
     ("wrong_response"),
-    [
-        b"",
-        MockSuperBv2BleakClient._NOTIFY_RESP[:-1],
-        MockSuperBv2BleakClient._NOTIFY_RESP + b"\x00",
-    ],
+    [b"", _NOTIFY_SHORT, _NOTIFY_LONG],
     ids=["empty", "too_short", "too_long"],
 )
 async def test_invalid_response(
@@ -181,9 +160,7 @@ async def test_invalid_response(
     """Test data up date with BMS returning invalid data."""
 
     patch_bms_timeout()
-    monkeypatch.setattr(
-        MockSuperBv2BleakClient, "_NOTIFY_RESP", bytearray(wrong_response)
-    )
+    monkeypatch.setattr(MockSuperBv2BleakClient, "_NOTIFY_RESP", wrong_response)
     patch_bleak_client(MockSuperBv2BleakClient)
 
     bms = BMS(generate_ble_device())
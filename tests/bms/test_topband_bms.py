@@ -1,22 +1,19 @@
 """Test the Topband BMS implementation."""
 
-from collections.abc import Awaitable, Callable
 from typing import Final
-from uuid import UUID
 
-from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak.backends.device import BLEDevice
 import pytest
 
 from aiobmsble import BMSSample, TempSensor as TS
 from aiobmsble.bms.topband_bms import BMS
-from tests.bluetooth import generate_ble_device
-from tests.conftest import MockBleakClient
+from tests import conftest
 from tests.test_basebms import BMSBasicTests
 
 BT_FRAME_SIZE = 32
 
-_PROTO_DEFS: Final[dict[int, bytearray]] = {
-    0x5E: bytearray(  # Ective
+_PROTO_DEFS: Final[dict[int, bytes]] = {
+    0x5E: (  # Ective
         b"\x36\x46\x32\x00\x5e\x38\x34\x33\x35\x30\x30\x30\x30\x46\x38\x43\x44\x46\x46\x46\x46"
         b"\x32\x43\x46\x39\x30\x32\x30\x30\x39\x37\x30\x31\x36\x32\x30\x30\x45\x31\x30\x42\x30"
         b"\x30\x30\x30\x30\x30\x30\x30\x35\x45\x30\x44\x37\x31\x30\x44\x36\x35\x30\x44\x35\x45"
@@ -25,7 +22,7 @@ _PROTO_DEFS: Final[dict[int, bytearray]] = {
         b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x39\x34\x46\xaf\x46\x38\x33\x33\x30\x30\x30\x30"
         b"\x30\x30\x30\x30\x30\x30\x30\x30\x00\x00\x00\x00\x00\x00\x00\x00"  # \xaf ... garbage
     ),
-    0x83: bytearray(  # StartCraft
+    0x83: (  # StartCraft
         b"\x83\x36\x32\x33\x34\x30\x30\x30\x30\x37\x36\x46\x45\x46\x46\x46\x46\x38\x38\x38\x41"
         b"\x30\x31\x30\x30\x31\x36\x30\x30\x36\x32\x30\x30\x35\x33\x30\x42\x30\x30\x38\x30\x30"
         b"\x37\x42\x34\x31\x36\x30\x44\x31\x37\x30\x44\x31\x39\x30\x44\x31\x43\x30\x44\x30\x30"
@@ -33,7 +30,7 @@ _PROTO_DEFS: Final[dict[int, bytearray]] = {
         b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
         b"\x30\x30\x30\x30\x30\x37\x43\x32\x11\x11\x11\x11\x11\x11\x11\x11"
     ),
-    0xB0: bytearray(  # KiloVault
+    0xB0: (  # KiloVault
         b"\xb0\x39\x30\x33\x33\x30\x30\x30\x30\x33\x45\x46\x45\x46\x46\x46\x46\x33\x34\x30\x46"
         b"\x30\x33\x30\x30\x37\x44\x30\x30\x35\x45\x30\x30\x39\x31\x30\x42\x30\x30\x30\x31\x30"
         b"\x30\x30\x30\x44\x45\x30\x43\x30\x38\x30\x44\x45\x32\x30\x43\x30\x35\x30\x44\x30\x30"
@@ -100,15 +97,12 @@ _RESULT_DEFS: Final[dict[int, BMSSample]] = {
     },
 }
 
-
-@pytest.fixture(
-    name="protocol_type",
-    params=[0x5E, 0x83, 0xB0],
-)
-def proto(request: pytest.FixtureRequest) -> int:
-    """Protocol fixture."""
-    assert isinstance(request.param, int)
-    return request.param
+_RESULT_PROBLEM: Final[BMSSample] = _RESULT_DEFS[0x5E] | {
+    "current": -13.0,
+    "power": -178.1,
+    "runtime": 53961,
+    "problem": True,
+}
 
 
 class TestBasicBMS(BMSBasicTests):
@@ -116,42 +110,26 @@ class TestBasicBMS(BMSBasicTests):
 
     bms_class = BMS
 
-class MockTopbandBleakClient(MockBleakClient):
+
+class MockTopbandBleakClient(conftest.MockFramedNotifyBleakClient):
     """Emulate a Topband BMS BleakClient."""
 
-    _RESP: bytearray = _PROTO_DEFS[0x5E]
-
-    def _send_info(self) -> None:
-        assert self._notify_callback is not None
-        for notify_data in [
-            self._RESP[i : i + BT_FRAME_SIZE]
-            for i in range(0, len(self._RESP), BT_FRAME_SIZE)
-        ]:
-            self._notify_callback("MockTopbandBleakClient", notify_data)
-
-    @property
-    def is_connected(self) -> bool:
-        """Mock connected to retrigger frame transmission in MockClient."""
-        if self._connected and self._notify_callback is not None:
-            self._send_info()  # patch to provide data when not reconnecting
-        return self._connected
-
-    async def start_notify(
-        self,
-        char_specifier: BleakGATTCharacteristic | int | str | UUID,
-        callback: Callable[
-            [BleakGATTCharacteristic, bytearray], None | Awaitable[None]
-        ],
-        **kwargs,
-    ) -> None:
-        """Mock start_notify."""
-        await super().start_notify(char_specifier, callback)
-        self._send_info()
+    _FRAME_SIZE = BT_FRAME_SIZE
+    _RESP: bytes = _PROTO_DEFS[0x5E]
 
 
+@pytest.mark.parametrize(
+    "protocol_type",
+    [
+        pytest.param(0x5E, id="Ective"),
+        pytest.param(0x83, id="StartCraft"),
+        pytest.param(0xB0, id="KiloVault"),
+    ],
+)
 async def test_update(
     monkeypatch: pytest.MonkeyPatch,
     patch_bleak_client,
+    ble_device: BLEDevice,
     protocol_type: int,
     keep_alive_fixture: bool,
 ) -> None:
@@ -160,75 +138,43 @@ async def test_update(
     monkeypatch.setattr(MockTopbandBleakClient, "_RESP", _PROTO_DEFS[protocol_type])
     patch_bleak_client(MockTopbandBleakClient)
 
-    bms = BMS(generate_ble_device(), keep_alive_fixture)
+    bms = BMS(ble_device, keep_alive_fixture)
 
-    assert await bms.async_update() == _RESULT_DEFS[protocol_type]
+    await conftest.run_double_update(
+        bms, _RESULT_DEFS[protocol_type], keep_alive_fixture
+    )
 
-    # query again to check already connected state
-    await bms.async_update()
-    assert bms.is_connected is keep_alive_fixture
 
-    await bms.disconnect()
-
-
-async def test_tx_notimplemented(patch_bleak_client) -> None:
+async def test_tx_notimplemented(patch_bleak_client, ble_device: BLEDevice) -> None:
     """Test Topband BMS uuid_tx not implemented for coverage."""
 
     patch_bleak_client(MockTopbandBleakClient)
 
-    bms = BMS(generate_ble_device(), False)
+    bms = BMS(ble_device, False)
 
     with pytest.raises(NotImplementedError):
         _ret = bms.uuid_tx()
 
 
+_FRAME_5E: Final[bytes] = (  # valid 0x5E frame without leading garbage
+    b"\x5e\x38\x34\x33\x35\x30\x30\x30\x30\x33\x38\x43\x44\x46\x46\x46\x46"
+    b"\x32\x43\x46\x39\x30\x32\x30\x30\x39\x37\x30\x31\x36\x32\x30\x30"
+    b"\x45\x31\x30\x42\x30\x30\x30\x30\x30\x30\x30\x30"
+    b"\x35\x45\x30\x44\x37\x31\x30\x44\x36\x35\x30\x44\x35\x45\x30\x44"
+    b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
+    b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
+    b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
+    b"\x30\x38\x38\x46"
+)
+
+
 @pytest.fixture(
     name="wrong_response",
     params=[
-        (
-            b"\x5e\x38\x34\x33\x35\x30\x30\x30\x30\x33\x38\x43\x44\x46\x46\x46\x46"
-            b"\x32\x43\x46\x39\x30\x32\x30\x30\x39\x37\x30\x31\x36\x32\x30\x30"
-            b"\x45\x31\x30\x42\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x35\x45\x30\x44\x37\x31\x30\x44\x36\x35\x30\x44\x35\x45\x30\x44"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x38\x38\x45\x00\x00\x00\x00\x00\x00\x00\x00",
-            "wrong_CRC",
-        ),
-        (
-            b"\x5a\x38\x34\x33\x35\x30\x30\x30\x30\x33\x38\x43\x44\x46\x46\x46\x46"
-            b"\x32\x43\x46\x39\x30\x32\x30\x30\x39\x37\x30\x31\x36\x32\x30\x30"
-            b"\x45\x31\x30\x42\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x35\x45\x30\x44\x37\x31\x30\x44\x36\x35\x30\x44\x35\x45\x30\x44"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x38\x38\x46\x00\x00\x00\x00\x00\x00\x00\x00",
-            "wrong_SOF",
-        ),
-        (
-            b"\x5e\x34\x33\x35\x30\x30\x30\x30\x33\x38\x43\x44\x46\x46\x46\x46"
-            b"\x32\x43\x46\x39\x30\x32\x30\x30\x39\x37\x30\x31\x36\x32\x30\x30"
-            b"\x45\x31\x30\x42\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x35\x45\x30\x44\x37\x31\x30\x44\x36\x35\x30\x44\x35\x45\x30\x44"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x38\x38\x46",
-            "wrong_length",  # 1st byte missing
-        ),
-        (
-            b"\x5e\x5e\x34\x33\x35\x30\x30\x30\x30\x33\x38\x43\x44\x46\x46\x46\x46"
-            b"\x32\x43\x46\x39\x30\x32\x30\x30\x39\x37\x30\x31\x36\x32\x30\x30"
-            b"\x45\x31\x30\x42\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x35\x45\x30\x44\x37\x31\x30\x44\x36\x35\x30\x44\x35\x45\x30\x44"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30"
-            b"\x30\x38\x38\x46",
-            "wrong_character",
-        ),
+        (_FRAME_5E[:-1] + b"\x45" + bytes(8), "wrong_CRC"),
+        (b"\x5a" + _FRAME_5E[1:] + bytes(8), "wrong_SOF"),
+        (_FRAME_5E[:1] + _FRAME_5E[2:], "wrong_length"),  # 1st byte missing
+        (_FRAME_5E[:1] + b"\x5e" + _FRAME_5E[2:], "wrong_character"),
     ],
     ids=lambda param: param[1],
 )
@@ -241,16 +187,17 @@ def response(request: pytest.FixtureRequest) -> bytes:
 async def test_invalid_response(
     monkeypatch: pytest.MonkeyPatch,
     patch_bleak_client,
+    ble_device: BLEDevice,
     patch_bms_timeout,
     wrong_response: bytes,
 ) -> None:
     """Test data up date with BMS returning invalid data."""
 
     patch_bms_timeout("topband_bms")
-    monkeypatch.setattr(MockTopbandBleakClient, "_RESP", bytearray(wrong_response))
+    monkeypatch.setattr(MockTopbandBleakClient, "_RESP", wrong_response)
     patch_bleak_client(MockTopbandBleakClient)
 
-    bms = BMS(generate_ble_device())
+    bms = BMS(ble_device)
 
     result: BMSSample = {}
     with pytest.raises(TimeoutError):
@@ -264,7 +211,7 @@ async def test_invalid_response(
     name="problem_response",
     params=[
         (
-            bytearray(
+            (
                 b"\x5e\x38\x34\x33\x35\x30\x30\x30\x30\x33\x38\x43\x44\x46\x46\x46\x46"
                 b"\x32\x43\x46\x39\x30\x32\x30\x30\x39\x37\x30\x31\x36\x32\x30\x30"
                 b"\x45\x31\x30\x42\x30\x31\x30\x30\x30\x30\x30\x30"
@@ -277,7 +224,7 @@ async def test_invalid_response(
             "first_bit",
         ),
         (
-            bytearray(
+            (
                 b"\x5e\x38\x34\x33\x35\x30\x30\x30\x30\x33\x38\x43\x44\x46\x46\x46\x46"
                 b"\x32\x43\x46\x39\x30\x32\x30\x30\x39\x37\x30\x31\x36\x32\x30\x30"
                 b"\x45\x31\x30\x42\x38\x30\x30\x30\x30\x30\x30\x30"
@@ -292,7 +239,7 @@ async def test_invalid_response(
     ],
     ids=lambda param: param[1],
 )
-def prb_response(request) -> tuple[bytearray, str]:
+def prb_response(request) -> tuple[bytes, str]:
     """Return faulty response frame."""
     return request.param
 
@@ -300,39 +247,20 @@ def prb_response(request) -> tuple[bytearray, str]:
 async def test_problem_response(
     monkeypatch: pytest.MonkeyPatch,
     patch_bleak_client,
-    problem_response: tuple[bytearray, str],
+    ble_device: BLEDevice,
+    problem_response: tuple[bytes, str],
 ) -> None:
     """Test data update with BMS returning error flags."""
 
-    monkeypatch.setattr(MockTopbandBleakClient, "_RESP", bytearray(problem_response[0]))
+    monkeypatch.setattr(MockTopbandBleakClient, "_RESP", problem_response[0])
 
     patch_bleak_client(MockTopbandBleakClient)
 
-    bms = BMS(generate_ble_device())
+    bms = BMS(ble_device)
 
     result: BMSSample = await bms.async_update()
-    assert result == {
-        "voltage": 13.7,
-        "current": -13.0,
-        "battery_level": 98,
-        "cycles": 407,
-        "cycle_charge": 194.86,
-        "cell_count": 4,
-        "cell_voltages": [
-            3.422,
-            3.441,
-            3.429,
-            3.422,
-        ],
-        "delta_voltage": 0.019,
-        "temperature": 30.95,
-        "temp_values": [30.95],
-        "cycle_capacity": 2669.582,
-        "power": -178.1,
-        "runtime": 53961,
-        "battery_charging": False,
-        "problem": True,
-        "problem_code": (1 if problem_response[1] == "first_bit" else 128),
+    assert result == _RESULT_PROBLEM | {
+        "problem_code": (1 if problem_response[1] == "first_bit" else 128)
     }
 
     await bms.disconnect()
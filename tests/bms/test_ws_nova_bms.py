@@ -1,21 +1,21 @@
 """Test the Wattstunde Nova BMS implementation."""
 
-from collections.abc import Buffer
+from collections.abc import Buffer, Iterable
 from typing import Final, cast
 from uuid import UUID
 
 from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak.backends.device import BLEDevice
 import pytest
 
 from aiobmsble import BMSSample, TempSensor as TS
 from aiobmsble.bms.ws_nova_bms import BMS
-from tests.bluetooth import generate_ble_device
-from tests.conftest import MockBleakClient
+from tests.conftest import MockBleakClient, run_double_update
 from tests.test_basebms import BMSBasicTests
 
 BT_FRAME_SIZE = 20
 
-_PROTO_DEFS: Final[bytearray] = bytearray(
+_PROTO_DEFS: Final[bytes] = (
     b"\x3a\x32\x31\x37\x34\x32\x31\x32\x30\x43\x43\x32\x30\x32\x31\x32\x32\x34\x39\x33"
     b"\x38\x38\x30\x43\x31\x32\x43\x39\x35\x32\x43\x39\x35\x32\x43\x39\x39\x32\x43\x39"
     b"\x34\x32\x30\x32\x30\x32\x30\x32\x30\x32\x30\x32\x30\x32\x30\x32\x30\x32\x30\x32"
@@ -56,6 +56,34 @@ _RESULT_DEFS: Final[BMSSample] = {
     "problem_code": 0,
 }
 
+_RESULT_PROBLEM: Final[BMSSample] = _RESULT_DEFS | {"problem": True}
+
+
+_KEY: Final[int] = int(_PROTO_DEFS[7:9], 16)  # XOR key of the frame payload
+_PROTO_FRAMES: Final[tuple[bytes, ...]] = tuple(
+    _PROTO_DEFS[i : i + BT_FRAME_SIZE]
+    for i in range(0, len(_PROTO_DEFS), BT_FRAME_SIZE)
+)
+
+
+def _frames(data: bytes) -> Iterable[bytes]:
+    """Return data split into notification frames."""
+    if data is _PROTO_DEFS:
+        return _PROTO_FRAMES
+    return (data[i : i + BT_FRAME_SIZE] for i in range(0, len(data), BT_FRAME_SIZE))
+
+
+def _encode(value: int, size: int = 2) -> bytes:
+    """Return value as XOR-keyed ASCII hex field of the reference frame."""
+    return bytes(b ^ _KEY for b in value.to_bytes(size)).hex().upper().encode()
+
+
+def _patched(offset: int, repl: bytes) -> bytearray:
+    """Return a copy of the reference frame with repl written at offset."""
+    frame: bytearray = bytearray(_PROTO_DEFS)
+    memoryview(frame)[offset : offset + len(repl)] = repl
+    return frame
+
 
 class TestBasicBMS(BMSBasicTests):
     """Test the basic BMS functionality."""
@@ -66,7 +94,7 @@ class TestBasicBMS(BMSBasicTests):
 class MockWSNovaBleakClient(MockBleakClient):
     """Emulate a Wattstunde Nova BMS BleakClient."""
 
-    _RESP: bytearray = _PROTO_DEFS
+    _RESP: bytes = _PROTO_DEFS
 
     async def write_gatt_char(
         self,
@@ -79,56 +107,47 @@ class MockWSNovaBleakClient(MockBleakClient):
         assert self._notify_callback is not None
         if char_specifier != "FFF1":
             return
-        for notify_data in [
-            self._RESP[i : i + BT_FRAME_SIZE]
-            for i in range(0, len(self._RESP), BT_FRAME_SIZE)
-        ]:
+        for notify_data in _frames(self._RESP):
             self._notify_callback("MockStreamBleakClient", notify_data)
 
 
 class MockStreamBleakClient(MockWSNovaBleakClient):
     """Emulate a Wattstunde Nova BMS BleakClient sending data in stream mode."""
 
-    _RESP_NOTIFY: bytearray = _PROTO_DEFS
+    _resp_notify: bytes = _PROTO_DEFS  # replaced per instance by the tests
 
     async def _notify(self) -> None:
         assert self._notify_callback is not None
-        for notify_data in [
-            self._RESP_NOTIFY[i : i + BT_FRAME_SIZE]
-            for i in range(0, len(self._RESP_NOTIFY), BT_FRAME_SIZE)
-        ]:
+        for notify_data in _frames(self._resp_notify):
             self._notify_callback("MockStreamBleakClient", notify_data)
 
 
 async def test_update(
-    monkeypatch: pytest.MonkeyPatch, patch_bleak_client, keep_alive_fixture: bool
+    monkeypatch: pytest.MonkeyPatch,
+    patch_bleak_client,
+    ble_device: BLEDevice,
+    keep_alive_fixture: bool,
 ) -> None:
     """Test Wattstunde Nova BMS data update."""
 
     monkeypatch.setattr(MockWSNovaBleakClient, "_RESP", _PROTO_DEFS)
     patch_bleak_client(MockWSNovaBleakClient)
 
-    bms = BMS(generate_ble_device(), keep_alive_fixture)
-
-    assert await bms.async_update() == _RESULT_DEFS
-
-    # query again to check already connected state
-    await bms.async_update()
-    assert bms.is_connected is keep_alive_fixture
+    bms = BMS(ble_device, keep_alive_fixture)
 
-    await bms.disconnect()
+    await run_double_update(bms, _RESULT_DEFS, keep_alive_fixture)
 
 
 async def test_stream_update(
-    monkeypatch: pytest.MonkeyPatch,
     patch_bleak_client,
+    ble_device: BLEDevice,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test Wattstunde Nova BMS stream data update."""
 
     patch_bleak_client(MockStreamBleakClient)
 
-    bms = BMS(generate_ble_device())
+    bms = BMS(ble_device)
 
     assert await bms.async_update() == _RESULT_DEFS
     assert bms._msg_event.is_set() is False, "BMS does not request fresh data"
@@ -136,9 +155,7 @@ async def test_stream_update(
 
     _client: MockStreamBleakClient = cast(MockStreamBleakClient, bms._client)
     caplog.clear()
-    _frame: bytearray = _PROTO_DEFS.copy()
-    _frame[135:139] = b"2029"  # change cycles from 5 to 9
-    monkeypatch.setattr(_client, "_RESP_NOTIFY", _frame)
+    _client._resp_notify = _patched(135, _encode(9))  # change cycles from 5 to 9
     await _client._notify()
 
     # query again to see if updated streaming data is used
@@ -147,19 +164,17 @@ async def test_stream_update(
 
     caplog.clear()
     # do not automatically send data this time
-    _frame = _PROTO_DEFS.copy()
-    _frame[135:139] = b"2429"  # change cycles from 9 to 73
-    monkeypatch.setattr(_client, "_RESP_NOTIFY", _frame)
+    _client._resp_notify = _patched(135, _encode(73))  # change cycles from 9 to 73
 
     # query again to see if BMS recovers if no data is sent
     assert await bms.async_update() == _RESULT_DEFS
     assert "requesting BMS data" in caplog.text, "BMS did not use streaming data"
 
 
-async def test_device_info(patch_bleak_client) -> None:
+async def test_device_info(patch_bleak_client, ble_device: BLEDevice) -> None:
     """Test that the BMS returns initialized dynamic device information."""
     patch_bleak_client(MockWSNovaBleakClient)
-    bms = BMS(generate_ble_device())
+    bms = BMS(ble_device)
     assert await bms.device_info() == {
         "serial_number": "5500724211093",
     }
@@ -189,16 +204,17 @@ async def test_device_info(patch_bleak_client) -> None:
 async def test_invalid_response(
     monkeypatch: pytest.MonkeyPatch,
     patch_bleak_client,
+    ble_device: BLEDevice,
     patch_bms_timeout,
     wrong_response: bytes,
 ) -> None:
     """Test data up date with BMS returning invalid data."""
 
     patch_bms_timeout()
-    monkeypatch.setattr(MockWSNovaBleakClient, "_RESP", bytearray(wrong_response))
+    monkeypatch.setattr(MockWSNovaBleakClient, "_RESP", wrong_response)
     patch_bleak_client(MockWSNovaBleakClient)
 
-    bms = BMS(generate_ble_device())
+    bms = BMS(ble_device)
 
     result: BMSSample = {}
     with pytest.raises(TimeoutError):
@@ -221,20 +237,19 @@ async def test_invalid_response(
 async def test_problem_response(
     monkeypatch: pytest.MonkeyPatch,
     patch_bleak_client,
+    ble_device: BLEDevice,
     problem_response: bytes,
     expected: int,
 ) -> None:
     """Test data update with BMS returning error flags."""
 
-    _resp: bytearray = _PROTO_DEFS.copy()
-    _resp[89:93] = problem_response
-    monkeypatch.setattr(MockWSNovaBleakClient, "_RESP", _resp)
+    monkeypatch.setattr(MockWSNovaBleakClient, "_RESP", _patched(89, problem_response))
 
     patch_bleak_client(MockWSNovaBleakClient)
 
-    bms = BMS(generate_ble_device())
+    bms = BMS(ble_device)
 
     result: BMSSample = await bms.async_update()
-    assert result == _RESULT_DEFS | {"problem": True, "problem_code": expected}
+    assert result == _RESULT_PROBLEM | {"problem_code": expected}
 
     await bms.disconnect()
@@ -5,9 +5,11 @@ License: Apache-2.0, http://www.apache.org/licenses/
 """
 
 from collections.abc import Awaitable, Buffer, Callable, Iterable
+from functools import lru_cache
 import logging
+import os
 from types import ModuleType
-from typing import Any, Final, cast
+from typing import Any, ClassVar, Final, cast
 from uuid import UUID
 
 from bleak import BleakClient
@@ -17,17 +19,25 @@ from bleak.backends.device import BLEDevice
 from bleak.backends.service import BleakGATTService, BleakGATTServiceCollection
 from bleak.exc import BleakCharacteristicNotFoundError
 from bleak.uuids import normalize_uuid_str
-from hypothesis import HealthCheck, settings
+from hypothesis import settings
 import pytest
 
 from aiobmsble import BMSSample, TempSensor as TS
+from aiobmsble.basebms import BaseBMS
 from aiobmsble.utils import load_bms_plugins
+from tests.bluetooth import generate_ble_device
 
 logging.basicConfig(level=logging.INFO)
 LOGGER: logging.Logger = logging.getLogger(__package__)
 
 pytest_plugins: list[str] = ["aiobmsble.test_data"]
 
+# the mocks only see a handful of UUIDs, avoid parsing them again on each call
+_normalize: Final[Callable[[str], str]] = lru_cache(maxsize=128)(normalize_uuid_str)
+
+# Hypothesis profiles selectable via HYPOTHESIS_PROFILE, "dev" by default
+HYPOTHESIS_PROFILES: Final[dict[str, int]] = {"dev": 100, "ci": 1000}
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add custom command-line option for max_examples."""
@@ -35,20 +45,19 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         "--max-examples",
         action="store",
         type=int,
-        default=1000,
-        help="Set the maximum number of examples for Hypothesis tests.",
+        default=None,
+        help="Override the maximum number of examples of the Hypothesis profile.",
     )
 
 
 def pytest_configure(config: pytest.Config) -> None:
     """Configure pytest with custom settings."""
-    max_examples: int = cast(int, config.getoption("--max-examples"))
-    settings.register_profile(
-        "default",
-        max_examples=max_examples,
-        suppress_health_check=[HealthCheck.function_scoped_fixture],
+    max_examples: Final[int | None] = cast(
+        int | None, config.getoption("--max-examples")
     )
-    settings.load_profile("default")
+    for profile, examples in HYPOTHESIS_PROFILES.items():
+        settings.register_profile(profile, max_examples=max_examples or examples)
+    settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
 
 
 @pytest.fixture(
@@ -63,6 +72,11 @@ def plugin_fixture(request: pytest.FixtureRequest) -> ModuleType:
     return request.param
 
 
+# device information service offered by MockBleakClient, only read by the BMS
+_SERVICES: Final[BleakGATTServiceCollection] = BleakGATTServiceCollection()
+_SERVICES.add_service(BleakGATTService(None, 0, _normalize("180a")))
+
+
 class MockBleakClient(BleakClient):
     """Mock bleak client."""
 
@@ -109,9 +123,7 @@ class MockBleakClient(BleakClient):
     @property
     def services(self) -> BleakGATTServiceCollection:
         """Mock GATT services."""
-        _services: BleakGATTServiceCollection = BleakGATTServiceCollection()
-        _services.add_service(BleakGATTService(None, 0, normalize_uuid_str("180a")))
-        return _services
+        return _SERVICES
 
     async def connect(self, **_kwargs: Any) -> None:
         """Mock connect."""
@@ -168,7 +180,9 @@ class MockBleakClient(BleakClient):
         assert self._connected, "read_gatt_char called, but client not connected."
 
         if isinstance(char_specifier, str):
-            char_specifier = normalize_uuid_str(char_specifier)[4:8]
+            # BMS requests the short UUID form, normalize others only
+            if char_specifier not in MockBleakClient.BT_INFO:
+                char_specifier = _normalize(char_specifier)[4:8]
             if char_specifier not in MockBleakClient.BT_INFO:
                 raise BleakCharacteristicNotFoundError(char_specifier)
             return bytearray(MockBleakClient.BT_INFO[char_specifier])
@@ -184,6 +198,56 @@ class MockBleakClient(BleakClient):
             self._disconnect_callback(self)
 
 
+class MockFramedNotifyBleakClient(MockBleakClient):
+    """Mock bleak client that notifies its response in frames on each is_connected check."""
+
+    _FRAME_SIZE: int = 20  # default BLE MTU payload size
+    _RESP: bytes = b""
+    _frames_src: ClassVar[bytes | None] = None
+    _frames_cache: ClassVar[tuple[bytes, ...]] = ()
+
+    def _notify_resp(self) -> bytes:
+        """Return the response to notify."""
+        return self._RESP
+
+    def _frames(self) -> tuple[bytes, ...]:
+        """Return the response split into notification frames, built once per response."""
+        cls: type[MockFramedNotifyBleakClient] = type(self)
+        src: Final[bytes] = self._notify_resp()
+        if cls._frames_src is not src:
+            cls._frames_cache = tuple(
+                src[i : i + self._FRAME_SIZE]
+                for i in range(0, len(src), self._FRAME_SIZE)
+            )
+            cls._frames_src = src
+        return cls._frames_cache
+
+    def _send_info(self) -> None:
+        notify: Final[Callable | None] = self._notify_callback
+        assert notify is not None
+        for notify_data in self._frames():
+            notify(type(self).__name__, notify_data)
+
+    @property
+    def is_connected(self) -> bool:
+        """Mock connected to retrigger frame transmission in MockClient."""
+        if self._connected and self._notify_callback is not None:
+            self._send_info()  # patch to provide data when not reconnecting
+        return self._connected
+
+    async def start_notify(
+        self,
+        char_specifier: BleakGATTCharacteristic | int | str | UUID,
+        callback: Callable[
+            [BleakGATTCharacteristic, bytearray], None | Awaitable[None]
+        ],
+        **kwargs: Any,
+    ) -> None:
+        """Mock start_notify."""
+        await super().start_notify(char_specifier, callback)
+        self._send_info()
+
+
 @pytest.fixture(params=[-13, 0, 21], ids=["neg_current", "zero_current", "pos_current"])
 def bms_data_fixture(request: pytest.FixtureRequest) -> BMSSample:
     """Return a fake BMS data dictionary."""
@@ -229,6 +293,19 @@ def patch_bleak_client(
     return _patch
 
 
+async def run_double_update(
+    bms: BaseBMS, expected: BMSSample, keep_alive: bool
+) -> None:
+    """Update BMS twice, check the first result and the connection state after."""
+    assert await bms.async_update() == expected
+
+    # query again to check already connected state
+    await bms.async_update()
+    assert bms.is_connected is keep_alive
+
+    await bms.disconnect()
+
+
 @pytest.fixture(params=[True, False], ids=["keep_alive", "reconnect"])
 def keep_alive_fixture(request: pytest.FixtureRequest) -> bool:
     """Return True, False for keep_alive test."""
@@ -236,6 +313,12 @@ def keep_alive_fixture(request: pytest.FixtureRequest) -> bool:
     return request.param
 
 
+@pytest.fixture(scope="session")
+def ble_device() -> BLEDevice:
+    """Return a default mock BLEDevice shared by all tests."""
+    return generate_ble_device()
+
+
 class DefGATTChar(BleakGATTCharacteristic):
     """Create BleakGATTCharacteristic with default values."""
 
@@ -246,9 +329,7 @@ class DefGATTChar(BleakGATTCharacteristic):
         obj: Any = None,
         properties: list[CharacteristicPropertyName] | None = None,
         max_write_without_response_size: Callable[[], int] | None = None,
-        service: BleakGATTService = BleakGATTService(
-            None, 0, normalize_uuid_str("fff0")
-        ),
+        service: BleakGATTService = BleakGATTService(None, 0, _normalize("fff0")),
     ) -> None:
         """Add default values for base class.
 
@@ -271,7 +352,7 @@ class DefGATTChar(BleakGATTCharacteristic):
         super().__init__(
             obj,
             handle,
-            normalize_uuid_str(uuid),
+            _normalize(uuid),
             properties or ["read"],
             max_write_without_response_size or (lambda: 512),
             service,
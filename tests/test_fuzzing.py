@@ -7,7 +7,7 @@ from typing import Final
 
 from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.service import BleakGATTService
-from hypothesis import given, strategies as st
+from hypothesis import HealthCheck, given, settings, strategies as st
 import pytest
 
 from aiobmsble.basebms import BaseBMS
@@ -15,6 +15,8 @@ from tests.bluetooth import generate_ble_device
 from tests.conftest import MockBleakClient
 
 
+@pytest.mark.slow
+@settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
 @given(
     data=st.binary(min_size=0, max_size=513)
 )  # ATT is not allowed larger than 512 bytes
@@ -39,18 +39,21 @@ async def mock_discover(
 
 
 @pytest.fixture(name="mock_setup_logging")
-def setup_logging():
+def setup_logging(monkeypatch: pytest.MonkeyPatch) -> mock.MagicMock:
     """Unittest mock for setup_logging to check calls to it."""
-    with mock.patch.object(main_mod, "setup_logging") as m:
-        yield m
+    m: Final[mock.MagicMock] = mock.MagicMock()
+    monkeypatch.setattr(main_mod, "setup_logging", m)
+    return m
 
 
 @pytest.fixture(name="mock_asyncio_run")
-def asyncio_run():
+def asyncio_run(monkeypatch: pytest.MonkeyPatch) -> mock.MagicMock:
     """Unittest mock for asyncio_run to check calls to it."""
-    with mock.patch("asyncio.run") as m:
-        m.side_effect = lambda coro: asyncio.new_event_loop().run_until_complete(coro)
-        yield m
+    m: Final[mock.MagicMock] = mock.MagicMock(
+        side_effect=lambda coro: asyncio.new_event_loop().run_until_complete(coro)
+    )
+    monkeypatch.setattr("asyncio.run", m)
+    return m
 
 
 async def test_detect_bms(
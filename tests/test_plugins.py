@@ -8,30 +8,52 @@ import pkgutil
 from types import ModuleType
 from typing import Final
 
+from bleak.backends.scanner import AdvertisementData
+import pytest
+
 import aiobmsble
 from aiobmsble.basebms import BaseBMS
 from aiobmsble.test_data import bms_advertisements, ignore_advertisements
 from aiobmsble.utils import bms_supported, load_bms_plugins
 
 
-def test_advertisements_unique() -> None:
+@pytest.mark.parametrize(
+    ("adv", "mac_addr", "bms_real", "_comments"),
+    [
+        pytest.param(*sample, id=f"{sample[2]}-{idx}")
+        for idx, sample in enumerate(bms_advertisements())
+    ],
+)
+def test_advertisements_unique(
+    adv: AdvertisementData, mac_addr: str, bms_real: str, _comments: list[str]
+) -> None:
     """Check that each advertisement only matches one, the right BMS."""
-    for adv, mac_addr, bms_real, _comments in bms_advertisements():
-        for bms_under_test in load_bms_plugins():
-            supported: bool = bms_supported(bms_under_test.BMS, adv, mac_addr)
-            assert supported == (
-                f"aiobmsble.bms.{bms_real}" == bms_under_test.__name__
-            ), f"{adv} {"incorrectly matches"if supported else "does not match"} {bms_under_test.__name__}!"
-
-
-def test_advertisements_ignore() -> None:
+    matches: set[str] = {
+        bms_under_test.__name__
+        for bms_under_test in load_bms_plugins()
+        if bms_supported(bms_under_test.BMS, adv, mac_addr)
+    }
+    assert matches == {
+        f"aiobmsble.bms.{bms_real}"
+    }, f"{adv} matches {sorted(matches)} instead of {bms_real}!"
+
+
+@pytest.mark.parametrize(
+    ("adv", "mac_addr", "reason", "_comments"),
+    [
+        pytest.param(*sample, id=f"ignore-{idx}")
+        for idx, sample in enumerate(ignore_advertisements())
+    ],
+)
+def test_advertisements_ignore(
+    adv: AdvertisementData, mac_addr: str, reason: str, _comments: list[str]
+) -> None:
     """Check that each advertisement to be ignored is actually ignored."""
-    for adv, mac_addr, reason, _comments in ignore_advertisements():
-        for bms_under_test in load_bms_plugins():
-            supported: bool = bms_supported(bms_under_test.BMS, adv, mac_addr)
-            assert (
-                not supported
-            ), f"{adv} incorrectly matches {bms_under_test.__name__}! {reason=}"
+    for bms_under_test in load_bms_plugins():
+        supported: bool = bms_supported(bms_under_test.BMS, adv, mac_addr)
+        assert (
+            not supported
+        ), f"{adv} incorrectly matches {bms_under_test.__name__}! {reason=}"
 
 
 def get_defined_methods(cls) -> list[str]: